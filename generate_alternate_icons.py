@@ -5,19 +5,26 @@ Creates Calculator, Weather, Notes, and Wellness icons
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+import numpy as np
 import os
 
+@lru_cache(maxsize=8)
+def gradient_ramp(height):
+    """Return the shared (height, 1, 1) vertical blend ramp for a gradient"""
+    ramp = np.linspace(0, 1, height, dtype=np.float32)[:, None, None]
+    ramp.flags.writeable = False
+    return ramp
+
 def create_gradient(width, height, color1, color2):
-    """Create a vertical gradient"""
-    base = Image.new('RGB', (width, height), color1)
-    top = Image.new('RGB', (width, height), color2)
-    mask = Image.new('L', (width, height))
-    mask_data = []
-    for y in range(height):
-        mask_data.extend([int(255 * (y / height))] * width)
-    mask.putdata(mask_data)
-    base.paste(top, (0, 0), mask)
-    return base
+    """Create an opaque vertical gradient as an RGBA image"""
+    # Blend factor per row, broadcast across columns and channels
+    t = gradient_ramp(height)
+    rgb = (1 - t) * np.array(color1, np.float32) + t * np.array(color2, np.float32)
+    arr = np.empty((height, width, 4), dtype=np.uint8)
+    arr[..., :3] = np.broadcast_to(rgb, (height, width, 3))
+    arr[..., 3] = 255
+    return Image.fromarray(arr, 'RGBA')
 
 def draw_calculator_icon(draw, center_x, center_y, size, color):
     """Draw calculator symbol (grid + display)"""
@@ -39,15 +46,18 @@ def draw_calculator_icon(draw, center_x, center_y, size, color):
     button_spacing = size // 15
     start_y = display_y + display_height + button_spacing * 2
     
-    for row in range(3):
-        for col in range(3):
-            x = center_x - button_size - button_spacing + col * (button_size + button_spacing)
-            y = start_y + row * (button_size + button_spacing)
-            draw.rounded_rectangle(
-                [x, y, x + button_size, y + button_size],
-                radius=button_size // 4,
-                fill=color
-            )
+    # Top-left corners of all nine buttons at once
+    pitch = button_size + button_spacing
+    xs = center_x - pitch + np.arange(3) * pitch
+    ys = start_y + np.arange(3) * pitch
+    grid_x, grid_y = np.meshgrid(xs, ys)
+
+    for x, y in zip(grid_x.ravel().tolist(), grid_y.ravel().tolist()):
+        draw.rounded_rectangle(
+            [x, y, x + button_size, y + button_size],
+            radius=button_size // 4,
+            fill=color
+        )
 
 def draw_weather_icon(draw, center_x, center_y, size, color):
     """Draw weather symbol (cloud with sun)"""
@@ -55,15 +65,20 @@ def draw_weather_icon(draw, center_x, center_y, size, color):
     ray_length = size // 6
     ray_width = size // 40
     num_rays = 8
-    
-    for i in range(num_rays):
-        angle = (i * 45) * 3.14159 / 180
-        import math
-        x1 = center_x + math.cos(angle) * (size // 4)
-        y1 = center_y - size // 6 + math.sin(angle) * (size // 4)
-        x2 = center_x + math.cos(angle) * (size // 4 + ray_length)
-        y2 = center_y - size // 6 + math.sin(angle) * (size // 4 + ray_length)
-        draw.line([x1, y1, x2, y2], fill=color, width=ray_width)
+
+    # Ray endpoints for all angles at once (45° apart)
+    angles = np.arange(num_rays) * (np.pi / 4)
+    cos, sin = np.cos(angles), np.sin(angles)
+    r0 = size // 4
+    r1 = r0 + ray_length
+    sun_y = center_y - size // 6
+    x1 = center_x + cos * r0
+    y1 = sun_y + sin * r0
+    x2 = center_x + cos * r1
+    y2 = sun_y + sin * r1
+
+    for ray in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist()):
+        draw.line(ray, fill=color, width=ray_width)
     
     # Sun circle
     sun_radius = size // 8
@@ -122,10 +137,11 @@ def draw_notes_icon(draw, center_x, center_y, size, color):
     # We'll use a darker shade of the background
     for i in range(4):
         line_y = paper_y + paper_height // 4 + i * line_spacing
-        # Draw white lines to create appearance of text
+        # Draw white lines to create appearance of text (opaque, so the
+        # RGBA canvas never picks up partial alpha)
         draw.rectangle(
             [line_x, line_y, line_x + line_width, line_y + line_height],
-            fill=(255, 255, 255, 180)
+            fill=color
         )
 
 def draw_wellness_icon(draw, center_x, center_y, size, color):
@@ -298,8 +314,8 @@ def draw_voicechanger_icon(draw, center_x, center_y, size, color):
             (sx - sparkle_size // 2, sy - sparkle_size // 2)
         ], fill=color)
 
-def create_alternate_icon(icon_type, output_dir, size=180):
-    """Create an alternate app icon"""
+def render_alternate_icon(icon_type, size=180):
+    """Render an alternate app icon and return it as an image"""
     
     # Define icon styles
     icon_configs = {
@@ -335,7 +351,7 @@ def create_alternate_icon(icon_type, output_dir, size=180):
     
     if icon_type not in icon_configs:
         print(f"❌ Unknown icon type: {icon_type}")
-        return
+        return None
     
     config = icon_configs[icon_type]
     color1, color2 = config['colors']
@@ -343,12 +359,16 @@ def create_alternate_icon(icon_type, output_dir, size=180):
     
     # Create gradient background
     img = create_gradient(size, size, color1, color2)
-    draw = ImageDraw.Draw(img, 'RGBA')
+    draw = ImageDraw.Draw(img)
     
     # Draw icon symbol in white
     symbol_size = int(size * 0.5)
     draw_func(draw, size // 2, size // 2, symbol_size, (255, 255, 255, 255))
     
+    return img
+
+def save_alternate_icon(img, icon_type, output_dir, size):
+    """Save a rendered icon using the @Nx filename for its size"""
     # Determine filename suffix
     scale = size // 60
     if scale == 1:
@@ -356,11 +376,32 @@ def create_alternate_icon(icon_type, output_dir, size=180):
     else:
         suffix = f"@{scale}x"
         
-    # Save the icon
+    # Save the icon (iOS app icons must be opaque, so drop the alpha channel here).
+    # Icons with at most 256 distinct colours are stored as palette PNGs, which
+    # is lossless for them and smaller overall; anti-aliased ones with more stay RGB.
     output_path = os.path.join(output_dir, f"{icon_type}{suffix}.png")
-    img.save(output_path, 'PNG')
+    opaque = img.convert('RGB')
+    if opaque.getcolors(256) is not None:
+        opaque = opaque.convert('P', palette=Image.Palette.ADAPTIVE, colors=256)
+    # Lighter deflate: slightly faster encode for somewhat larger files
+    opaque.save(output_path, 'PNG', compress_level=3, optimize=False)
     print(f"✅ Created {icon_type} icon: {output_path}")
 
+def create_alternate_icon(icon_type, output_dir, sizes=(180, 120, 60)):
+    """Create an alternate app icon at each of the given sizes"""
+    # Draw once at the largest size and downsample for the smaller ones
+    largest = max(sizes)
+    img = render_alternate_icon(icon_type, largest)
+    if img is None:
+        return
+    
+    for size in sizes:
+        if size == largest:
+            scaled = img
+        else:
+            scaled = img.resize((size, size), Image.Resampling.LANCZOS)
+        save_alternate_icon(scaled, icon_type, output_dir, size)
+
 def main():
     """Generate all alternate app icons"""
     # Create Icons directory in VoiceIt/
@@ -371,14 +412,7 @@ def main():
     
     # Generate @1x (60x60), @2x (120x120) and @3x (180x180) for each icon
     for icon_type in icon_types:
-        # @1x version (60x60) - base size
-        create_alternate_icon(icon_type, output_dir, 60)
-        
-        # @2x version (120x120)
-        create_alternate_icon(icon_type, output_dir, 120)
-        
-        # @3x version (180x180)
-        create_alternate_icon(icon_type, output_dir, 180)
+        create_alternate_icon(icon_type, output_dir, (60, 120, 180))
     
     print(f"\n🎉 All alternate icons generated successfully!")
     print(f"📁 Icons saved to: {output_dir}/")
@@ -398,7 +432,7 @@ if __name__ == '__main__':
     except ImportError:
         print("❌ Error: PIL (Pillow) is not installed")
         print("\n💡 To fix this, install Pillow:")
-        print("   pip3 install Pillow")
+        print("   pip3 install Pillow numpy")
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
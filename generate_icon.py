@@ -4,19 +4,17 @@ Generate VoiceIt app icon with waveform symbol
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
 import os
 
 def create_gradient(width, height, color1, color2):
     """Create a vertical gradient"""
-    base = Image.new('RGB', (width, height), color1)
-    top = Image.new('RGB', (width, height), color2)
-    mask = Image.new('L', (width, height))
-    mask_data = []
-    for y in range(height):
-        mask_data.extend([int(255 * (y / height))] * width)
-    mask.putdata(mask_data)
-    base.paste(top, (0, 0), mask)
-    return base
+    # Blend factor per row, broadcast across columns and channels
+    t = np.linspace(0, 1, height, dtype=np.float32)[:, None]
+    rgb = ((1 - t)[..., None] * np.array(color1, np.float32)
+           + t[..., None] * np.array(color2, np.float32))
+    arr = np.ascontiguousarray(np.broadcast_to(rgb, (height, width, 3)), dtype=np.uint8)
+    return Image.fromarray(arr, 'RGB')
 
 def draw_waveform(draw, center_x, center_y, size, color):
     """Draw a simple waveform icon"""
@@ -72,5 +70,5 @@ if __name__ == '__main__':
     except Exception as e:
         print(f"❌ Error: {e}")
         print(f"\n💡 To fix this, install Pillow:")
-        print(f"   pip3 install Pillow")
+        print(f"   pip3 install Pillow numpy")
 